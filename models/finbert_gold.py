@@ -12,8 +12,17 @@ from transformers import AutoModelForSequenceClassification, AutoTokenizer
 # which is widely used for financial sentiment.
 MODEL_NAME = "yiyanghkust/finbert-tone"
 
+# Opt-in reduced-precision inference: on CPU the Linear layers are dynamically
+# quantized to int8, on CUDA the model runs in fp16. Faster, but the published
+# scores shift slightly (and, on CPU, depend a little on which texts share a
+# batch in analyze_batch), so the default stays full fp32 precision.
+USE_REDUCED_PRECISION = False
 
-@dataclass
+# Number of texts per forward pass in analyze_batch.
+BATCH_SIZE = 32
+
+
+@dataclass(slots=True)
 class SentimentScores:
     positive: float
     negative: float
@@ -40,9 +49,22 @@ def _ensure_model_loaded() -> None:
     _device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
     _tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-    _model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
-    _model.to(_device)
-    _model.eval()
+    model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
+    model.eval()
+    if USE_REDUCED_PRECISION:
+        if _device.type == "cuda":
+            model.half()
+        else:
+            try:
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            except (AttributeError, RuntimeError):
+                # torch.ao.quantization is deprecated; if this torch no longer
+                # provides it (or lacks an int8 backend), stay on fp32.
+                pass
+    model.to(_device)
+    _model = model
 
 
 def _softmax(logits: torch.Tensor) -> torch.Tensor:
@@ -90,19 +112,57 @@ def analyze_text(text: str) -> SentimentScores:
 
     with torch.no_grad():
         outputs = _model(**inputs)
-        logits = outputs.logits
+        logits = outputs.logits.float()
         probs = _softmax(logits)[0].detach().cpu().tolist()
 
     id2label = getattr(_model.config, "id2label", {i: str(i) for i in range(len(probs))})
     return _extract_scores(id2label, probs)
 
 
-def analyze_batch(texts: List[str]) -> List[SentimentScores]:
-    """Analyze a batch of texts and return a list of SentimentScores."""
+def analyze_batch(texts: List[str], batch_size: int = BATCH_SIZE) -> List[SentimentScores]:
+    """Analyze a batch of texts and return a list of SentimentScores.
+
+    Texts are sorted by length and fed to the model ``batch_size`` at a time,
+    so each mini-batch is only padded to its own longest text. Results are
+    returned in the original order.
+
+    In fp32 the scores match ``analyze_text`` to float rounding (~1e-7). With
+    ``USE_REDUCED_PRECISION`` on CPU, int8 dynamic quantization picks one
+    activation scale per forward pass, so a text's scores shift slightly
+    (order 1e-4) with the other texts in its mini-batch; pass
+    ``batch_size=1`` if scores must not depend on batch composition.
+    """
+
+    # Empty texts keep the same neutral default as analyze_text.
+    results: List[SentimentScores] = [
+        SentimentScores(positive=0.0, negative=0.0, neutral=1.0) for _ in texts
+    ]
+    order = [i for i, t in enumerate(texts) if t]
+
+    if order:
+        _ensure_model_loaded()
+        assert _tokenizer is not None and _model is not None and _device is not None
+
+        order.sort(key=lambda i: len(texts[i]))
+        id2label = getattr(_model.config, "id2label", None)
+        for start in range(0, len(order), batch_size):
+            chunk = order[start:start + batch_size]
+            inputs = _tokenizer(
+                [texts[i] for i in chunk],
+                return_tensors="pt",
+                truncation=True,
+                max_length=256,
+                padding=True,
+            ).to(_device)
+
+            with torch.no_grad():
+                logits = _model(**inputs).logits.float()
+                probs = _softmax(logits).detach().cpu().tolist()
+
+            for i, p in zip(chunk, probs):
+                labels = id2label or {j: str(j) for j in range(len(p))}
+                results[i] = _extract_scores(labels, p)
 
-    results: List[SentimentScores] = []
-    for t in texts:
-        results.append(analyze_text(t))
     return results
 
 
@@ -1,40 +1,21 @@
 from __future__ import annotations
 
-import json
+import hashlib
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
+import msgpack
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SENTIMENT_RESULTS_PATH = PROJECT_ROOT / "docs" / "sentiment_results.json"
+SENTIMENT_RESULTS_PATH = PROJECT_ROOT / "docs" / "sentiment_results.msgpack"
 DASHBOARD_HTML_PATH = PROJECT_ROOT / "docs" / "index.html"
+# Hash of the published index.html, for hosting setups that send it as ETag.
+DASHBOARD_ETAG_PATH = PROJECT_ROOT / "docs" / "index.etag"
 
 
-def _load_current_result() -> Dict[str, Any] | None:
-    """Load the latest sentiment_results.json produced by analysis.
-
-    This file contains the current GSI, classification, and timestamp.
-    """
-
-    if not SENTIMENT_RESULTS_PATH.exists():
-        return None
-    try:
-        return json.loads(SENTIMENT_RESULTS_PATH.read_text(encoding="utf-8"))
-    except Exception:
-        return None
-
-
-def generate_dashboard() -> None:
-    """Generate a dashboard that loads the latest GSI from gsi_value.json.
-
-    This HTML is static and can be hosted on GitHub Pages. The heavy work
-    (NewsAPI + FinBERT + index calculation) still runs in Python and stores
-    the current value in ``gsi_value.json``. When the page is opened, a small
-    JavaScript loop fetches that JSON file and updates the gauge.
-    """
-
-    html = """<!DOCTYPE html>
+_DASHBOARD_HTML_SOURCE = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -190,12 +171,32 @@ def generate_dashboard() -> None:
         }
       }
 
+      async function fetchLatest() {
+        // The manifest is tiny and revalidated on every poll ('no-cache'
+        // sends If-None-Match, so unchanged data costs a 304). It names a
+        // content-hashed snapshot that never changes once published.
+        try {
+          const manifestResp = await fetch('gsi_manifest.json', { cache: 'no-cache' });
+          if (manifestResp.ok) {
+            const manifest = await manifestResp.json();
+            if (manifest && manifest.current) {
+              const resp = await fetch(manifest.current);
+              if (resp.ok) return await resp.json();
+            }
+          }
+        } catch (err) {
+          console.warn('GSI manifest unavailable, using gsi_value.json', err);
+        }
+
+        const resp = await fetch('gsi_value.json', { cache: 'no-cache' });
+        if (!resp.ok) throw new Error('HTTP ' + resp.status);
+        return resp.json();
+      }
+
       async function fetchAndUpdate() {
         try {
           if (updatedEl) updatedEl.textContent = 'Fetching latest data…';
-          const resp = await fetch('gsi_value.json?cache=' + Date.now());
-          if (!resp.ok) throw new Error('HTTP ' + resp.status);
-          const data = await resp.json();
+          const data = await fetchLatest();
           applyPayload(data);
         } catch (err) {
           console.error('Failed to load GSI', err);
@@ -212,7 +213,59 @@ def generate_dashboard() -> None:
 </html>
 """
 
-    DASHBOARD_HTML_PATH.write_text(html, encoding="utf-8")
+
+def _minify_html(html: str) -> str:
+    """Conservatively shrink the dashboard page.
+
+    Drops indentation, blank lines and whole-line ``//`` comments. Line breaks
+    are kept so JavaScript's automatic semicolon insertion is unaffected, and
+    nothing inside a line is rewritten.
+    """
+
+    lines = []
+    for line in html.splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+# Static dashboard page, minified and encoded once at import time.
+_DASHBOARD_HTML = _minify_html(_DASHBOARD_HTML_SOURCE).encode("utf-8")
+_DASHBOARD_ETAG = hashlib.blake2b(_DASHBOARD_HTML, digest_size=8).hexdigest()
+
+
+def _load_current_result() -> Dict[str, Any] | None:
+    """Load the latest sentiment_results.msgpack produced by analysis.
+
+    This file contains the current GSI, classification, and timestamp.
+    """
+
+    if not SENTIMENT_RESULTS_PATH.exists():
+        return None
+    try:
+        return msgpack.unpackb(SENTIMENT_RESULTS_PATH.read_bytes(), raw=False)
+    except Exception:
+        return None
+
+
+def generate_dashboard() -> None:
+    """Generate a dashboard that loads the latest GSI from gsi_value.json.
+
+    This HTML is static and can be hosted on GitHub Pages. The heavy work
+    (NewsAPI + FinBERT + index calculation) still runs in Python and stores
+    the current value in ``gsi_value.json``. When the page is opened, a small
+    JavaScript loop revalidates ``gsi_manifest.json``, fetches the
+    content-hashed snapshot it points to, and updates the gauge. It falls
+    back to ``gsi_value.json`` if the manifest is missing.
+
+    Alongside ``index.html`` it writes ``index.etag``, a content hash a
+    reverse proxy can serve as ``ETag: "<hash>"`` to answer revisits with 304.
+    """
+
+    DASHBOARD_HTML_PATH.write_bytes(_DASHBOARD_HTML)
+    DASHBOARD_ETAG_PATH.write_text(_DASHBOARD_ETAG + "\n", encoding="utf-8")
 
 
 if __name__ == "__main__":
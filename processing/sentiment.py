@@ -1,10 +1,40 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import asdict, dataclass
+import os
+import re
+import sys
+import tempfile
+import warnings
+from bisect import bisect_left
 from datetime import datetime, timezone, timedelta, date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
+
+import msgpack
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional speedup
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional, for very large news.json
+    ijson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
 
 from models.finbert_gold import SentimentScores, analyze_batch
 from processing.index_calc import IndexComponents, compute_index
@@ -12,8 +42,16 @@ from processing.index_calc import IndexComponents, compute_index
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 NEWS_JSON_PATH = PROJECT_ROOT / "news.json" 
-SENTIMENT_RESULTS_PATH = PROJECT_ROOT / "docs" / "sentiment_results.json"
+SENTIMENT_RESULTS_PATH = PROJECT_ROOT / "docs" / "sentiment_results.msgpack"
 GSI_VALUE_PATH = PROJECT_ROOT / "docs" / "gsi_value.json"
+GSI_MANIFEST_PATH = PROJECT_ROOT / "docs" / "gsi_manifest.json"
+
+# Article fields read by the analysis; everything else in news.json is skipped.
+NEWS_FIELDS = ("title", "description", "content", "url", "timestamp")
+
+# news.json files larger than this are streamed article by article (needs
+# ijson) instead of being parsed into memory in one go.
+NEWS_STREAM_MIN_BYTES = 32 * 1024 * 1024
 
 HIGH_IMPACT_KEYWORDS = [
     "powell",
@@ -40,37 +78,117 @@ HIGH_IMPACT_KEYWORDS = [
 ]
 
 
-@dataclass
-class DocumentSentiment:
-    source: str  # "news"
-    id: str
-    timestamp: str
-    text: str
-    sentiment: SentimentScores
-
-    def to_dict(self) -> Dict[str, Any]:
-        d = {
-            "source": self.source,
-            "id": self.id,
-            "timestamp": self.timestamp,
-            "text": self.text,
-        }
-        d.update({
-            "positive": self.sentiment.positive,
-            "negative": self.sentiment.negative,
-            "neutral": self.sentiment.neutral,
-        })
-        return d
+def _build_impact_automaton() -> Any:
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in HIGH_IMPACT_KEYWORDS:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+# Single-pass matcher for HIGH_IMPACT_KEYWORDS (None without pyahocorasick).
+_IMPACT_AUTOMATON = _build_impact_automaton()
+
+# Fallback matcher: one alternation scanned by the C regex engine, instead of
+# one substring scan per keyword.
+_IMPACT_RE = re.compile("|".join(re.escape(k) for k in HIGH_IMPACT_KEYWORDS))
+
+
+def _has_impact_keyword(txt: str) -> bool:
+    """Return True if lower-cased ``txt`` contains any HIGH_IMPACT_KEYWORDS."""
+
+    if _IMPACT_AUTOMATON is not None:
+        return next(_IMPACT_AUTOMATON.iter(txt), None) is not None
+    return _IMPACT_RE.search(txt) is not None
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` as indented UTF-8 JSON (same layout either way)."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never see a half-written file."""
+
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        tmp = Path(f.name)
+    try:
+        tmp.write_bytes(data)
+        # mkstemp creates 0600 files; published files must stay world-readable.
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def _load_json(path: Path) -> Any:
     if not path.exists():
         return []
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _json_loads(path.read_bytes())
+
+
+def _stream_recent_news(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield trimmed articles from ``path`` one at a time, skipping stale ones.
+
+    Only one article is materialized at a time, and articles that already
+    have a zero recency weight are dropped before anything is copied. Since
+    articles only get older, dropping them here never changes the result.
+    """
+
+    now = datetime.now(timezone.utc)
+    with path.open("rb") as f:
+        for art in ijson.items(f, "item"):
+            if _recency_weight(art.get("timestamp", ""), now) <= 0:
+                continue
+            yield {k: art[k] for k in NEWS_FIELDS if k in art}
+
+
+@lru_cache(maxsize=4)
+def _load_news_cached(
+    path: Path, mtime_ns: int, size: int
+) -> Tuple[Dict[str, Any], ...]:
+    """Parse the news file at ``path``, keeping only the fields we use.
+
+    ``mtime_ns`` and ``size`` only complete the cache key, so an unchanged
+    file is parsed once per process. Very large files are streamed with ijson; other
+    files are parsed On-Demand with pysimdjson when installed, so only the
+    ``NEWS_FIELDS`` of each article are ever turned into Python objects.
+    """
+
+    if ijson is not None and size >= NEWS_STREAM_MIN_BYTES:
+        return tuple(_stream_recent_news(path))
+
+    if simdjson is not None:
+        doc = simdjson.Parser().parse(path.read_bytes())
+        return tuple({k: art[k] for k in NEWS_FIELDS if k in art} for art in doc)
+
+    return tuple(
+        {k: art[k] for k in NEWS_FIELDS if k in art}
+        for art in (_load_json(path) or [])
+    )
 
 
 def _load_news() -> List[Dict[str, Any]]:
-    return list(_load_json(NEWS_JSON_PATH) or [])
+    path = NEWS_JSON_PATH
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return []
+    return list(_load_news_cached(path, st.st_mtime_ns, st.st_size))
 
 
 def _extract_news_text(article: Dict[str, Any]) -> str:
@@ -82,9 +200,27 @@ def _extract_news_text(article: Dict[str, Any]) -> str:
     return " \n".join(p for p in parts if p)
 
 
-def _recency_weight(ts_str: str) -> float:
+def _prepare_article(article: Dict[str, Any]) -> Tuple[str, str] | None:
+    """Return ``(text, text_lower)`` for an article, or None if it has no text."""
+
+    text = _extract_news_text(article)
+    if not text.strip():
+        return None
+    return text, text.lower()
+
+
+# Upper age bound (days, inclusive) of each recency bucket and its weight; the
+# extra trailing weight applies to anything older than the last cutoff.
+_RECENCY_CUTOFFS_DAYS = (1.0, 3.0, 7.0, 14.0, 30.0)
+_RECENCY_WEIGHTS = (1.0, 0.8, 0.6, 0.3, 0.1, 0.0)
+
+
+def _recency_weight(ts_str: str, now: datetime | None = None) -> float:
     """Return a recency weight in [0, 1] based on how old the item is.
 
+    ``now`` (UTC) defaults to the current time; pass it in when weighting many
+    items so the clock is read once.
+
     Heuristic rules (days old → weight):
       0–1   → 1.0   (very fresh)
       1–3   → 0.8
@@ -97,30 +233,67 @@ def _recency_weight(ts_str: str) -> float:
     if not ts_str:
         return 0.0
 
+    ts_str = str(ts_str)
     try:
-        ts = datetime.fromisoformat(str(ts_str).replace("Z", "+00:00"))
-    except Exception:
-        return 0.0
-
-    now = datetime.now(timezone.utc)
+        # The C parser is fastest when fed the stored string as is; only
+        # Python < 3.11 needs a trailing "Z" spelled out as "+00:00".
+        ts = datetime.fromisoformat(ts_str)
+    except ValueError:
+        if not ts_str.endswith("Z"):
+            return 0.0
+        try:
+            ts = datetime.fromisoformat(ts_str[:-1] + "+00:00")
+        except ValueError:
+            return 0.0
+
+    if now is None:
+        now = datetime.now(timezone.utc)
     age_days = max(0.0, (now - ts).total_seconds() / 86400.0)
+    return _RECENCY_WEIGHTS[bisect_left(_RECENCY_CUTOFFS_DAYS, age_days)]
+
 
-    if age_days <= 1:
-        return 1.0
-    if age_days <= 3:
-        return 0.8
-    if age_days <= 7:
-        return 0.6
-    if age_days <= 14:
-        return 0.3
-    if age_days <= 30:
-        return 0.1
-    return 0.0
+def _recency_weights_batch(
+    ts_list: List[str], now: datetime | None = None
+) -> np.ndarray:
+    """Vectorized ``_recency_weight`` over a list of timestamps.
+
+    news.json stores UTC ISO timestamps, which NumPy parses in one call once
+    the ``Z`` / ``+00:00`` suffix is dropped. If any entry does not fit that
+    shape, we fall back to ``_recency_weight`` per item.
+    """
 
+    stripped: List[str] = []
+    for ts in ts_list:
+        s = str(ts or "")
+        if s.endswith("Z"):
+            s = s[:-1]
+        elif s.endswith("+00:00"):
+            s = s[:-6]
+        stripped.append(s)
 
-def _impact_weight(score: SentimentScores, text: str) -> float:
+    try:
+        with warnings.catch_warnings():
+            # NumPy only warns on other UTC offsets; treat those as misses.
+            warnings.simplefilter("error")
+            ts_arr = np.array(stripped, dtype="datetime64[us]")
+    except (ValueError, Warning):
+        return np.array([_recency_weight(ts, now) for ts in ts_list], dtype=float)
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+    now_np = np.datetime64(now.astimezone(timezone.utc).replace(tzinfo=None), "us")
+    # Missing timestamps become NaT -> NaN age, which sorts past the last
+    # cutoff and so gets weight 0.
+    age_days = (now_np - ts_arr) / np.timedelta64(1, "D")
+    idx = np.searchsorted(_RECENCY_CUTOFFS_DAYS, age_days, side="left")
+    return np.asarray(_RECENCY_WEIGHTS)[idx]
+
+
+def _impact_weight(score: SentimentScores, text_lower: str) -> float:
     """Return an impact weight for a document.
 
+    ``text_lower`` is the document text, already lower-cased by the caller.
+
     Combines:
       - confidence: |positive - negative| in [0, 1]
       - impact keywords: Fed/Powell/rates/crisis/etc. get a boost
@@ -131,9 +304,8 @@ def _impact_weight(score: SentimentScores, text: str) -> float:
     # Base confidence in [0, 1]
     base = max(margin, 1e-3)
 
-    txt = text.lower()
     impact_boost = 1.0
-    if any(k in txt for k in HIGH_IMPACT_KEYWORDS):
+    if _has_impact_keyword(text_lower):
         impact_boost = 3.0  # macro headline like Powell moves the needle more
 
     # Non-linear emphasis: small margins shrink, large margins grow.
@@ -150,41 +322,45 @@ def analyze_documents() -> Dict[str, Any]:
     """
 
     news_raw = _load_news()
+    now = datetime.now(timezone.utc)
+    all_weights = _recency_weights_batch(
+        [n.get("timestamp", "") for n in news_raw], now
+    )
 
     news_items: List[Dict[str, Any]] = []
     recency_weights: List[float] = []
     texts: List[str] = []
-    for n in news_raw:
-        w = _recency_weight(n.get("timestamp", ""))
-        if w <= 0:
-            continue
-        text = _extract_news_text(n)
-        if not text.strip():
+    texts_lower: List[str] = []
+    for i in np.flatnonzero(all_weights > 0).tolist():
+        n = news_raw[i]
+        prepared = _prepare_article(n)
+        if prepared is None:
             continue
+        text, text_lower = prepared
         news_items.append(n)
-        recency_weights.append(w)
+        recency_weights.append(float(all_weights[i]))
         texts.append(text)
+        texts_lower.append(text_lower)
 
     news_scores: List[SentimentScores] = analyze_batch(texts) if texts else []
 
-    # Combine recency and impact (confidence + macro keywords) into a single
-    # effective weight per doc.
+    # Single pass: combine recency and impact (confidence + macro keywords)
+    # into an effective weight per doc and build its output record.
     effective_weights: List[float] = []
-    for s, w, text in zip(news_scores, recency_weights, texts):
-        impact = _impact_weight(s, text)
-        effective_weights.append(w * impact)
-
-    news_docs: List[DocumentSentiment] = []
-    for raw, s in zip(news_items, news_scores):
-        news_docs.append(
-            DocumentSentiment(
-                source="news",
-                id=str(raw.get("url", "")),
-                timestamp=str(raw.get("timestamp", "")),
-                text=_extract_news_text(raw),
-                sentiment=s,
-            )
-        )
+    documents: List[Dict[str, Any]] = []
+    for raw, text, text_lower, w, s in zip(
+        news_items, texts, texts_lower, recency_weights, news_scores
+    ):
+        effective_weights.append(w * _impact_weight(s, text_lower))
+        documents.append({
+            "source": "news",
+            "id": str(raw.get("url", "")),
+            "timestamp": str(raw.get("timestamp", "")),
+            "text": text,
+            "positive": s.positive,
+            "negative": s.negative,
+            "neutral": s.neutral,
+        })
 
     components: IndexComponents = compute_index(
         news_scores,
@@ -196,8 +372,8 @@ def analyze_documents() -> Dict[str, Any]:
     result = {
         "timestamp": now_iso,
         "news": {
-            "count": len(news_docs),
-            "documents": [d.to_dict() for d in news_docs],
+            "count": len(documents),
+            "documents": documents,
             "nw": components.nw,
             "nw_norm": components.nw_norm,
         },
@@ -209,9 +385,9 @@ def analyze_documents() -> Dict[str, Any]:
 
 
 def save_results(result: Dict[str, Any]) -> None:
-    SENTIMENT_RESULTS_PATH.write_text(
-        json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    # Only read back by Python, so a compact binary format is enough here;
+    # gsi_value.json stays JSON for the browser.
+    _write_atomic(SENTIMENT_RESULTS_PATH, msgpack.packb(result, use_bin_type=True))
 
     gsi_payload = {
         "timestamp": result["timestamp"],
@@ -219,9 +395,28 @@ def save_results(result: Dict[str, Any]) -> None:
         "classification": result["classification"],
         "nw_norm": result["news"]["nw_norm"],
     }
-    GSI_VALUE_PATH.write_text(
-        json.dumps(gsi_payload, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    gsi_bytes = _json_dumps(gsi_payload)
+    _write_atomic(GSI_VALUE_PATH, gsi_bytes)
+    _publish_hashed_gsi(gsi_bytes)
+
+
+def _publish_hashed_gsi(gsi_bytes: bytes) -> None:
+    """Write a content-addressed copy of gsi_value.json plus a manifest.
+
+    The dashboard revalidates the small ``gsi_manifest.json`` and then loads
+    ``gsi_value.<hash>.json``, which never changes once written and can be
+    served from the browser cache. Older hashed copies are removed.
+    """
+
+    digest = hashlib.blake2b(gsi_bytes, digest_size=6).hexdigest()
+    hashed_path = GSI_VALUE_PATH.with_name(f"gsi_value.{digest}.json")
+    if not hashed_path.exists():
+        _write_atomic(hashed_path, gsi_bytes)
+    _write_atomic(GSI_MANIFEST_PATH, _json_dumps({"current": hashed_path.name}))
+
+    for old in GSI_VALUE_PATH.parent.glob("gsi_value.*.json"):
+        if old != hashed_path:
+            old.unlink(missing_ok=True)
 
 
 def run_analysis_only() -> None:
@@ -234,7 +429,39 @@ def run_analysis_only() -> None:
 def run_full_pipeline() -> None:
     """Placeholder kept for symmetry; scraping is orchestrated in run.py."""
 
+    # Scraping may just have rewritten news.json; don't trust the cache.
+    _load_news_cached.cache_clear()
     run_analysis_only()
 
 
+def run_watch() -> None:
+    """Re-run the analysis whenever news.json changes (blocks forever).
+
+    Needs the optional ``watchfiles`` package. Analysis runs once at start so
+    the published files match the current news.json. Deleting news.json
+    never triggers a run, so the last published GSI is kept rather than
+    replaced by the empty-input value.
+    """
+
+    from watchfiles import Change, watch
+
+    def _is_news_update(change: Change, path: str) -> bool:
+        return (
+            change in (Change.added, Change.modified)
+            and Path(path).name == NEWS_JSON_PATH.name
+        )
 
+    if NEWS_JSON_PATH.exists():
+        run_analysis_only()
+    for _changes in watch(
+        NEWS_JSON_PATH.parent,
+        watch_filter=_is_news_update,
+        recursive=False,
+    ):
+        if not NEWS_JSON_PATH.exists():
+            continue
+        try:
+            run_analysis_only()
+        except Exception as exc:
+            # e.g. news.json caught mid-write; the next change event retries.
+            print(f"Analysis failed: {exc}", file=sys.stderr)
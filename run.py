@@ -4,7 +4,7 @@ import sys
 from pathlib import Path
 
 from scraping.newsapi import run_cli as news_cli
-from processing.sentiment import run_analysis_only
+from processing.sentiment import run_analysis_only, run_watch
 from processing.dashboard import generate_dashboard
 
 
@@ -15,7 +15,8 @@ USAGE = """Usage:
   python run.py sentiment update     # fetch NewsAPI, analyze, update JSON + dashboard
   python run.py sentiment news       # fetch NewsAPI only
   python run.py sentiment analyze    # run FinBERT on existing news.json + update dashboard
-  python run.py sentiment dashboard  # regenerate dashboard.html from existing sentiment_results.json
+  python run.py sentiment dashboard  # regenerate dashboard.html from existing sentiment_results.msgpack
+  python run.py sentiment watch      # re-run analysis whenever news.json changes (needs watchfiles)
 """
 
 
@@ -35,11 +36,16 @@ def cmd_analyze() -> None:
     generate_dashboard()
 
 
+def cmd_watch() -> None:
+    generate_dashboard()
+    run_watch()
+
+
 def cmd_dashboard_only() -> None:
-    """Regenerate dashboard.html from the latest sentiment_results.json.
+    """Regenerate dashboard.html from the latest sentiment_results.msgpack.
 
     This does NOT fetch new data or rerun FinBERT; it only redraws the gauge
-    using whatever is currently stored in sentiment_results.json.
+    using whatever is currently stored in sentiment_results.msgpack.
     """
 
     generate_dashboard()
@@ -62,6 +68,8 @@ def main(argv: list[str] | None = None) -> None:
         cmd_analyze()
     elif sub == "dashboard":
         cmd_dashboard_only()
+    elif sub == "watch":
+        cmd_watch()
     else:
         print(USAGE)
 